@@ -24,6 +24,7 @@ show_usage() {
     echo "  --exclude-groups GROUPS      Comma-separated list of groups to exclude"
     echo "  --remove-extra-members       Remove users/groups from AWS SSO if not in Google"
     echo "  --log-retention DAYS         CloudWatch log retention days (default: 30)"
+    echo "  --cache-ttl SECONDS          Reuse config and AWS SSO listings between runs; keep above the schedule interval (default: 1200)"
     echo "  -h, --help                   Show this help message"
     echo ""
     echo "Example:"
@@ -83,6 +84,10 @@ while [[ $# -gt 0 ]]; do
             LOG_RETENTION="$2"
             shift 2
             ;;
+        --cache-ttl)
+            CACHE_TTL="$2"
+            shift 2
+            ;;
         -h|--help)
             show_usage
             exit 0
@@ -149,6 +154,7 @@ PARAMETER_OVERRIDES=(
     "SyncSchedule=${SYNC_SCHEDULE:-rate(15 minutes)}"
     "RemoveExtraMembers=${REMOVE_EXTRA_MEMBERS:-false}"
     "LogRetentionDays=${LOG_RETENTION:-30}"
+    "CacheTtlSeconds=${CACHE_TTL:-1200}"
 )
 
 # Handle include/exclude groups separately to avoid CloudFormation CommaDelimitedList issues
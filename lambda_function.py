@@ -2,158 +2,505 @@ import json
 import boto3
 import logging
 import base64
-import re
-from typing import Dict, List, Optional
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import google_auth_httplib2
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # Configure logging
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+try:
+    logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+except ValueError:
+    logger.setLevel(logging.INFO)
 
-# Compile regex pattern once for better performance
-LOG_SANITIZE_PATTERN = re.compile(r'[\r\n\x00-\x1f\x7f-\x9f]')
+# Translation table that drops newlines and other control characters (C0, DEL and C1)
+LOG_SANITIZE_TABLE = dict.fromkeys([*range(0x00, 0x20), *range(0x7f, 0xa0)])
+
+# Group member listings per Directory API batch request, and batches in flight at once.
+# Every call in a batch counts against the per-user quota (2,400 queries/minute by default),
+# so together these cap concurrent members().list calls at GOOGLE_BATCH_SIZE * GOOGLE_MAX_WORKERS
+GOOGLE_BATCH_SIZE = 25
+GOOGLE_MAX_WORKERS = 2
+
+# Upper bound on concurrent Identity Store mutations (Identity Store throttles aggressively)
+AWS_MAX_WORKERS = 10
+
+# Upper bound on concurrent Identity Store membership listings
+AWS_LIST_MAX_WORKERS = 20
+
+# One boto3 session per Lambda container; every AWS client is built from it with a pool
+# large enough for the worker pools sharing it and adaptive retries for throttling
+_BOTO_SESSION = boto3.session.Session()
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True
+)
+
+# Largest page sizes each API accepts, to keep paginated round trips to a minimum
+AWS_PAGE_SIZE = 100
+GOOGLE_PAGE_SIZE = 200
+
+# Retries (with exponential backoff) for rate-limited or failed Directory API requests
+GOOGLE_NUM_RETRIES = 5
+
+# Partial responses: only request the Directory API fields the sync actually reads
+GOOGLE_GROUP_FIELDS = 'nextPageToken,groups(name,email,description)'
+GOOGLE_MEMBER_FIELDS = 'nextPageToken,members(email,type)'
+GOOGLE_USER_FIELDS = 'nextPageToken,users(primaryEmail,name)'
+
+# Include lists up to this size are looked up by name instead of listing every group
+GOOGLE_QUERY_MAX_GROUPS = 50
+
+# Safety limit for very large Google groups
+MAX_GROUP_MEMBERS = 10000
+
+# How long a warm Lambda container reuses its config and Identity Store listings.
+# Must exceed the sync schedule interval for scheduled runs to benefit; 0 disables reuse.
+try:
+    CACHE_TTL_SECONDS = int(os.environ.get('CACHE_TTL_SECONDS', 1200))
+except ValueError:
+    CACHE_TTL_SECONDS = 1200
+
+# Optional S3 bucket where Identity Store listings are shared between containers and runs
+CACHE_BUCKET = os.environ.get('CACHE_BUCKET')
+
+# Secrets Manager secret holding the sync configuration
+SECRET_NAME = "gsuite-aws-sso-sync-config"
+
+# Sync service kept across warm invocations of the same Lambda container
+_SYNC_SERVICE: Optional['GSuiteAWSSSOSync'] = None
 
 def sanitize_for_log(value: str) -> str:
     """Sanitize user input for safe logging"""
     if not isinstance(value, str):
         value = str(value)
     # Remove newlines and control characters
-    return LOG_SANITIZE_PATTERN.sub('', value)
+    return value.translate(LOG_SANITIZE_TABLE)
+
+@lru_cache(maxsize=None)
+def _aws_client(service_name: str):
+    """Return the container-wide client for an AWS service, creating it on first use"""
+    return _BOTO_SESSION.client(service_name, config=AWS_CLIENT_CONFIG)
+
+def _preload_config() -> Optional[Dict]:
+    """Fetch the configuration during the Lambda INIT phase so the first invocation doesn't wait on it"""
+    # Only preload inside Lambda; imports elsewhere (tooling, local runs) must not call AWS
+    if 'AWS_LAMBDA_FUNCTION_NAME' not in os.environ:
+        return None
+
+    try:
+        response = _aws_client('secretsmanager').get_secret_value(SecretId=SECRET_NAME)
+        return json.loads(response['SecretString'])
+    except Exception as e:
+        # The handler loads the config again and reports the failure there
+        logger.warning("Could not preload config from Secrets Manager: %s", e)
+        return None
+
+# Configuration fetched at cold start, consumed by the first sync service instance
+_PRELOADED_CONFIG = _preload_config()
+
+@lru_cache(maxsize=1)
+def _delegated_credentials(service_account_b64: str, scopes: Tuple[str, ...], subject: str) -> Credentials:
+    """Build delegated credentials once per container so their access token outlives a single invocation"""
+    # Decode base64 service account key; json.loads detects the UTF-8 encoding of the raw bytes
+    service_account_info = json.loads(base64.b64decode(service_account_b64))
+
+    credentials = Credentials.from_service_account_info(service_account_info, scopes=list(scopes))
+
+    # Use domain-wide delegation
+    return credentials.with_subject(subject)
 
 class GSuiteAWSSSOSync:
     def __init__(self):
         """Initialize the sync service with AWS services"""
+        # Configuration and the Google Workspace client are loaded lazily on first use
         try:
-            self.secrets_client = boto3.client('secretsmanager')
-            self.identity_store = boto3.client('identitystore')
+            # Clients are shared by every instance built in this container
+            self.secrets_client = _aws_client('secretsmanager')
+            self.identity_store = _aws_client('identitystore')
+            self._thread_local = threading.local()
+            self.s3_client = _aws_client('s3') if CACHE_BUCKET else None
+            self._cache = {}
+            self._cache_expires_at = {}
+            self.created_at = time.monotonic()
+        except Exception as e:
+            logger.error("Failed to initialize sync service: %s", e)
+            raise
 
-            # Load configuration from Secrets Manager
-            self.config = self._load_config()
-            self.identity_store_id = self.config['aws']['identity_store_id']
+    def is_expired(self) -> bool:
+        """Check whether the cached config and listings are too old to reuse"""
+        return time.monotonic() - self.created_at > CACHE_TTL_SECONDS
+
+    def _cached(self, key: str, loader: Callable[[], Any], shared: bool = True) -> Any:
+        """Return a listing cached by an earlier invocation, loading it on first use
+
+        Shared listings are also persisted to the S3 cache bucket, when one is configured.
+        """
+        if key not in self._cache:
+            value = self._load_shared_cache(key) if shared else None
+            if value is None:
+                value = loader()
+                # Empty results usually mean the listing failed, so don't keep them around
+                if not value:
+                    return value
+                if shared:
+                    self._cache_expires_at[key] = time.time() + CACHE_TTL_SECONDS
+            self._cache[key] = value
+        return self._cache[key]
+
+    def _shared_cache_key(self, key: str) -> str:
+        """Build the S3 object key for a shared cache entry"""
+        return f"{self.identity_store_id}/{key}.json"
+
+    def _load_shared_cache(self, key: str) -> Optional[Dict]:
+        """Load a listing persisted to S3 by an earlier run if it has not expired"""
+        if not self.s3_client:
+            return None
 
-            # Initialize Google Workspace client
-            self.google_service = self._init_google_service()
+        try:
+            response = self.s3_client.get_object(Bucket=CACHE_BUCKET, Key=self._shared_cache_key(key))
+            entry = json.loads(response['Body'].read())
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'NoSuchKey':
+                logger.warning("Could not read cached %s from S3: %s", key, sanitize_for_log(str(e)))
+            return None
         except Exception as e:
-            logger.error(f"Failed to initialize sync service: {e}")
-            raise
+            logger.warning("Could not read cached %s from S3: %s", key, sanitize_for_log(str(e)))
+            return None
+
+        if entry.get('expires_at', 0) <= time.time():
+            return None
+
+        logger.info("Using cached %s from S3", key)
+        self._cache_expires_at[key] = entry['expires_at']
+        return entry['items']
+
+    def save_shared_cache(self):
+        """Persist cached listings to S3 so later runs can skip the full enumeration"""
+        if not self.s3_client:
+            return
+
+        for key, expires_at in self._cache_expires_at.items():
+            try:
+                # Keep the original expiry so entries are refreshed from the source on schedule
+                self.s3_client.put_object(
+                    Bucket=CACHE_BUCKET,
+                    Key=self._shared_cache_key(key),
+                    Body=json.dumps({'expires_at': expires_at, 'items': self._cache[key]}),
+                    ContentType='application/json'
+                )
+            except Exception as e:
+                logger.warning("Could not write cached %s to S3: %s", key, sanitize_for_log(str(e)))
 
     def _load_config(self) -> Dict:
         """Load configuration from AWS Secrets Manager"""
         try:
-            secret_name = "gsuite-aws-sso-sync-config"
-            response = self.secrets_client.get_secret_value(SecretId=secret_name)
+            response = self.secrets_client.get_secret_value(SecretId=SECRET_NAME)
             return json.loads(response['SecretString'])
         except Exception as e:
-            logger.error(f"Error loading config from Secrets Manager: {e}")
+            logger.error("Error loading config from Secrets Manager: %s", e)
             raise
 
-    def _init_google_service(self):
-        """Initialize Google Workspace Admin SDK service"""
+    @cached_property
+    def config(self) -> Dict:
+        """Configuration from Secrets Manager, loaded on first use"""
+        global _PRELOADED_CONFIG
+        # Use the copy fetched during INIT once; later instances reload it to pick up changes
+        if _PRELOADED_CONFIG is not None:
+            config, _PRELOADED_CONFIG = _PRELOADED_CONFIG, None
+            return config
+        return self._load_config()
+
+    @cached_property
+    def identity_store_id(self) -> str:
+        """AWS SSO Identity Store ID from the configuration"""
+        return self.config['aws']['identity_store_id']
+
+    @cached_property
+    def sync_config(self) -> Dict:
+        """Sync options from the configuration"""
+        return self.config.get('sync') or {}
+
+    @cached_property
+    def google_credentials(self) -> Credentials:
+        """Delegated Google service account credentials, built on first use"""
         try:
-            # Decode base64 service account key
-            service_account_b64 = self.config['google']['service_account_key_b64']
-            service_account_json = base64.b64decode(service_account_b64).decode('utf-8')
-            service_account_info = json.loads(service_account_json)
-
-            credentials = Credentials.from_service_account_info(
-                service_account_info,
-                scopes=self.config['google']['scopes']
-            )
-
-            # Use domain-wide delegation
-            delegated_credentials = credentials.with_subject(
+            # Shared across warm invocations while the secret is unchanged, so the access
+            # token minted on the first run is reused until google-auth sees it expire
+            return _delegated_credentials(
+                self.config['google']['service_account_key_b64'],
+                tuple(self.config['google']['scopes']),
                 self.config['google']['admin_email']
             )
-
-            return build('admin', 'directory_v1', credentials=delegated_credentials)
         except Exception as e:
-            logger.error(f"Error initializing Google service: {e}")
+            logger.error("Error initializing Google credentials: %s", e)
             raise
 
-    def get_google_groups(self) -> List[Dict]:
-        """Fetch all groups from Google Workspace (all domains)"""
-        logger.info("Fetching groups from Google Workspace...")
-        groups = []
-
+    @cached_property
+    def google_service(self):
+        """Google Workspace Admin SDK service, built on first use"""
         try:
-            # Get groups from the primary domain
+            # Share the calling thread's keep-alive transport instead of opening another one,
+            # and use the discovery document bundled with the client library
+            return build(
+                'admin', 'directory_v1',
+                http=self._google_http(),
+                cache_discovery=False,
+                static_discovery=True
+            )
+        except Exception as e:
+            logger.error("Error initializing Google service: %s", e)
+            raise
+
+    def _google_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Return an authorized HTTP transport owned by the calling thread"""
+        # httplib2.Http is not thread-safe, so each worker thread gets its own connection.
+        # Each one keeps its TLS connection to googleapis.com alive between requests; build_http
+        # sets the socket timeout so a stalled connection raises (and is retried) instead of hanging
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.google_credentials, http=build_http())
+            self._thread_local.http = http
+        return http
+
+    def iter_google_group_pages(self) -> Iterator[List[Dict]]:
+        """Yield pages of groups from Google Workspace (all domains) as they arrive"""
+        # A customer-wide listing already covers the primary domain, so only fall back to
+        # the domain listing when the customer listing is not permitted
+        scopes = [{'customer': 'my_customer'}, {'domain': self.config['google']['domain']}]
+
+        for scope in scopes:
             request = self.google_service.groups().list(
-                domain=self.config['google']['domain']
+                maxResults=GOOGLE_PAGE_SIZE,
+                fields=GOOGLE_GROUP_FIELDS,
+                **scope
             )
+            try:
+                response = request.execute(http=self._google_http(), num_retries=GOOGLE_NUM_RETRIES)
+            except Exception as e:
+                if scope is scopes[-1]:
+                    raise
+                logger.warning("Could not fetch groups from all domains: %s", e)
+                continue
 
-            while request is not None:
-                response = request.execute()
-                groups.extend(response.get('groups', []))
+            while True:
+                yield response.get('groups', [])
                 request = self.google_service.groups().list_next(request, response)
+                if request is None:
+                    return
+                response = request.execute(http=self._google_http(), num_retries=GOOGLE_NUM_RETRIES)
 
-            # Get groups by customer ID to catch all domains
-            try:
-                request = self.google_service.groups().list(
-                    customer='my_customer'
-                )
+    def query_google_groups(self, group_names: List[str]) -> Optional[List[Dict]]:
+        """Look up groups by exact name on the server instead of listing every group
 
-                while request is not None:
-                    response = request.execute()
-                    all_groups = response.get('groups', [])
-                    # Add groups that aren't already in our list
-                    existing_emails = {g['email'] for g in groups}
-                    for group in all_groups:
-                        if group['email'] not in existing_emails:
-                            groups.append(group)
-                    request = self.google_service.groups().list_next(request, response)
-            except Exception as e:
-                logger.warning(f"Could not fetch groups from all domains: {e}")
+        Returns None if any lookup fails so the caller can fall back to a full listing.
+        """
+        groups = {}
+        failed = []
 
+        def collect(request_id, response, exception):
+            if exception is not None:
+                failed.append(request_id)
+                return
+            for group in response.get('groups', []):
+                groups[group['email']] = group
+
+        try:
+            batch = self.google_service.new_batch_http_request(callback=collect)
+            for i, group_name in enumerate(group_names):
+                batch.add(
+                    self.google_service.groups().list(
+                        customer='my_customer',
+                        query=f"name='{group_name}'",
+                        maxResults=GOOGLE_PAGE_SIZE,
+                        fields=GOOGLE_GROUP_FIELDS
+                    ),
+                    request_id=str(i)
+                )
+            batch.execute(http=self._google_http())
         except Exception as e:
-            logger.error(f"Error fetching Google groups: {e}")
-            return []
+            logger.warning("Could not look up included groups by name: %s", e)
+            return None
 
-        logger.info(f"Found {len(groups)} groups in Google Workspace")
-        return groups
+        if failed:
+            logger.warning("Could not look up %s included groups by name", len(failed))
+            return None
+
+        return list(groups.values())
+
+    def _google_group_pages(self) -> Iterable[List[Dict]]:
+        """Pick the cheapest way to list the Google groups that may be synced"""
+        include_list = self.sync_config.get('include_groups')
+        # Names with quotes can't be expressed in a query, so those lists use the full scan
+        if (include_list and len(include_list) <= GOOGLE_QUERY_MAX_GROUPS
+                and not any("'" in name for name in include_list)):
+            groups = self.query_google_groups(include_list)
+            if groups is not None:
+                return [groups]
+        return self.iter_google_group_pages()
+
+    def _warn_truncated(self, group_email: str):
+        """Log that a group's member list was cut off at MAX_GROUP_MEMBERS"""
+        logger.warning("Group %s has over %s members, truncating", sanitize_for_log(group_email), MAX_GROUP_MEMBERS)
 
-    def get_google_group_members(self, group_email: str) -> List[Dict]:
-        """Fetch members of a specific Google group with proper pagination"""
+    def get_google_group_members(self, group_email: str) -> Optional[List[Dict]]:
+        """Fetch members of a specific Google group with proper pagination
+
+        Returns None if the members could not be fetched, so the group isn't mistaken for an empty one.
+        """
         members = []
 
         try:
-            request = self.google_service.members().list(groupKey=group_email)
+            request = self.google_service.members().list(
+                groupKey=group_email,
+                maxResults=GOOGLE_PAGE_SIZE,
+                fields=GOOGLE_MEMBER_FIELDS
+            )
 
             while request is not None:
-                response = request.execute()
+                response = request.execute(http=self._google_http(), num_retries=GOOGLE_NUM_RETRIES)
                 page_members = response.get('members', [])
                 members.extend(page_members)
                 request = self.google_service.members().list_next(request, response)
                 
                 # Safety check for large groups
-                if len(members) > 10000:
-                    logger.warning(f"Group {sanitize_for_log(group_email)} has over 10,000 members, truncating")
+                if len(members) > MAX_GROUP_MEMBERS:
+                    self._warn_truncated(group_email)
                     break
 
         except Exception as e:
-            logger.error(f"Error fetching members for group {sanitize_for_log(group_email)}: {e}")
-            return []
+            logger.error("Error fetching members for group %s: %s", sanitize_for_log(group_email), e)
+            return None
 
         return members
 
+    def _get_google_members_batch(self, group_emails: List[str]) -> Dict[str, Optional[List[Dict]]]:
+        """Fetch members of up to GOOGLE_BATCH_SIZE groups using Directory API batch requests"""
+        members = {email: [] for email in group_emails}
+        page_tokens = dict.fromkeys(group_emails)
+        failed = []
+
+        def collect(group_email, response, exception):
+            if exception is not None:
+                failed.append(group_email)
+                return
+            members[group_email].extend(response.get('members', []))
+            next_page_token = response.get('nextPageToken')
+            if not next_page_token:
+                return
+            # Safety check for large groups
+            if len(members[group_email]) > MAX_GROUP_MEMBERS:
+                self._warn_truncated(group_email)
+                return
+            page_tokens[group_email] = next_page_token
+
+        # Each round fetches the next page of every group that still has one
+        while page_tokens:
+            batch = self.google_service.new_batch_http_request(callback=collect)
+            for group_email, page_token in page_tokens.items():
+                batch.add(
+                    self.google_service.members().list(
+                        groupKey=group_email,
+                        maxResults=GOOGLE_PAGE_SIZE,
+                        fields=GOOGLE_MEMBER_FIELDS,
+                        pageToken=page_token
+                    ),
+                    request_id=group_email
+                )
+            page_tokens.clear()
+            batch.execute(http=self._google_http())
+
+        # Retry groups whose batched call failed (e.g. rate limited) one at a time
+        for group_email in failed:
+            members[group_email] = self.get_google_group_members(group_email)
+
+        return members
+
+    def _get_google_members_chunk(self, group_emails: List[str]) -> Dict[str, Optional[List[Dict]]]:
+        """Fetch members of a chunk of groups, falling back to one group at a time if the batch fails"""
+        try:
+            return self._get_google_members_batch(group_emails)
+        except Exception as e:
+            logger.error("Error batch fetching Google group members: %s", e)
+            return {email: self.get_google_group_members(email) for email in group_emails}
+
+    def filter_groups(self, groups: Iterable[Dict]) -> Iterator[Dict]:
+        """Apply the include/exclude group configuration"""
+        include_list = self.sync_config.get('include_groups')
+        exclude_list = self.sync_config.get('exclude_groups')
+        if include_list:
+            include_names = set(include_list)
+            return (g for g in groups if g['name'] in include_names)
+        elif exclude_list:
+            exclude_names = set(exclude_list)
+            return (g for g in groups if g['name'] not in exclude_names)
+        return iter(groups)
+
+    def get_google_groups_and_members(self) -> Tuple[List[Dict], Dict[str, Optional[List[Dict]]]]:
+        """Stream Google groups, fetching members of each page's synced groups while later pages load
+
+        Returns all groups together with the members of the groups that pass the filter
+        (None for groups whose members could not be fetched).
+        """
+        logger.info("Fetching groups from Google Workspace...")
+        groups = []
+        member_futures = []
+
+        with ThreadPoolExecutor(max_workers=GOOGLE_MAX_WORKERS) as executor:
+            try:
+                for page in self._google_group_pages():
+                    groups.extend(page)
+                    group_emails = [g['email'] for g in self.filter_groups(page)]
+                    for i in range(0, len(group_emails), GOOGLE_BATCH_SIZE):
+                        member_futures.append(
+                            executor.submit(self._get_google_members_chunk, group_emails[i:i + GOOGLE_BATCH_SIZE])
+                        )
+            except Exception as e:
+                logger.error("Error fetching Google groups: %s", e)
+                return [], {}
+
+            members = {}
+            for future in member_futures:
+                members.update(future.result())
+
+        fetched = sum(1 for group_members in members.values() if group_members is not None)
+        logger.info("Found %s groups in Google Workspace, fetched members for %s", len(groups), fetched)
+        return groups, members
+
+    def _paginate(self, operation: str, **kwargs):
+        """Iterate over Identity Store result pages using the largest page size"""
+        paginator = self.identity_store.get_paginator(operation)
+        return paginator.paginate(
+            IdentityStoreId=self.identity_store_id,
+            PaginationConfig={'PageSize': AWS_PAGE_SIZE},
+            **kwargs
+        )
+
     def get_aws_groups(self) -> Dict[str, str]:
         """Fetch all groups from AWS SSO Identity Store"""
         logger.info("Fetching groups from AWS SSO...")
         groups = {}
 
         try:
-            paginator = self.identity_store.get_paginator('list_groups')
-
-            for page in paginator.paginate(IdentityStoreId=self.identity_store_id):
+            for page in self._paginate('list_groups'):
                 for group in page['Groups']:
                     groups[group['DisplayName']] = group['GroupId']
 
         except Exception as e:
-            logger.error(f"Error fetching AWS SSO groups: {e}")
+            logger.error("Error fetching AWS SSO groups: %s", e)
             return {}
 
-        logger.info(f"Found {len(groups)} groups in AWS SSO")
+        logger.info("Found %s groups in AWS SSO", len(groups))
         return groups
 
     def get_aws_users(self) -> Dict[str, str]:
@@ -162,19 +509,18 @@ class GSuiteAWSSSOSync:
         users = {}
 
         try:
-            paginator = self.identity_store.get_paginator('list_users')
-
-            for page in paginator.paginate(IdentityStoreId=self.identity_store_id):
+            for page in self._paginate('list_users'):
                 for user in page['Users']:
-                    primary_email = next((email['Value'] for email in user.get('Emails', []) if email.get('Primary', False)), None)
-                    if primary_email:
-                        users[primary_email] = user['UserId']
+                    for email in user.get('Emails') or ():
+                        if email.get('Primary'):
+                            users[email['Value']] = user['UserId']
+                            break
 
         except Exception as e:
-            logger.error(f"Error fetching AWS SSO users: {e}")
+            logger.error("Error fetching AWS SSO users: %s", e)
             return {}
 
-        logger.info(f"Found {len(users)} users in AWS SSO")
+        logger.info("Found %s users in AWS SSO", len(users))
         return users
 
     def get_google_users(self) -> List[Dict]:
@@ -185,27 +531,56 @@ class GSuiteAWSSSOSync:
         try:
             request = self.google_service.users().list(
                 domain=self.config['google']['domain'],
-                maxResults=500
+                maxResults=500,
+                fields=GOOGLE_USER_FIELDS
             )
 
             while request is not None:
-                response = request.execute()
+                response = request.execute(http=self._google_http(), num_retries=GOOGLE_NUM_RETRIES)
                 users.extend(response.get('users', []))
                 request = self.google_service.users().list_next(request, response)
 
         except Exception as e:
-            logger.error(f"Error fetching Google users: {e}")
+            logger.error("Error fetching Google users: %s", e)
             return []
 
-        logger.info(f"Found {len(users)} users in Google Workspace")
+        logger.info("Found %s users in Google Workspace", len(users))
         return users
 
+    def resolve_user_id(self, user_name: str) -> Optional[str]:
+        """Look up a single AWS SSO user ID by user name without listing all users"""
+        try:
+            response = self.identity_store.get_user_id(
+                IdentityStoreId=self.identity_store_id,
+                AlternateIdentifier={
+                    'UniqueAttribute': {'AttributePath': 'UserName', 'AttributeValue': user_name}
+                }
+            )
+            return response['UserId']
+        except Exception as e:
+            logger.error("Error looking up user %s: %s", sanitize_for_log(user_name), sanitize_for_log(str(e)))
+            return None
+
+    def resolve_group_id(self, group_name: str) -> Optional[str]:
+        """Look up a single AWS SSO group ID by display name without listing all groups"""
+        try:
+            response = self.identity_store.get_group_id(
+                IdentityStoreId=self.identity_store_id,
+                AlternateIdentifier={
+                    'UniqueAttribute': {'AttributePath': 'DisplayName', 'AttributeValue': group_name}
+                }
+            )
+            return response['GroupId']
+        except Exception as e:
+            logger.error("Error looking up group %s: %s", sanitize_for_log(group_name), sanitize_for_log(str(e)))
+            return None
+
     def create_aws_user(self, google_user: Dict) -> Optional[str]:
         """Create a new user in AWS SSO from Google user data"""
         primary_email = google_user.get('primaryEmail', 'unknown')
         try:
             if not google_user.get('primaryEmail'):
-                logger.warning(f"No primary email found for user: {sanitize_for_log(str(google_user))}")
+                logger.warning("No primary email found for user: %s", sanitize_for_log(str(google_user)))
                 return None
 
             # Extract name components
@@ -232,18 +607,19 @@ class GSuiteAWSSSOSync:
             )
 
             user_id = response['UserId']
-            logger.info(f"Created AWS SSO user: {sanitize_for_log(primary_email)} ({user_id})")
+            logger.info("Created AWS SSO user: %s (%s)", sanitize_for_log(primary_email), user_id)
             return user_id
 
         except ClientError as e:
             if e.response['Error']['Code'] == 'ConflictException':
-                logger.warning(f"User {sanitize_for_log(primary_email)} already exists")
-                return None
+                # The user exists but was missing from our listing (e.g. a cached one), so look it up
+                logger.warning("User %s already exists", sanitize_for_log(primary_email))
+                return self.resolve_user_id(primary_email)
             else:
-                logger.error(f"Error creating user {sanitize_for_log(primary_email)}: {sanitize_for_log(str(e))}")
+                logger.error("Error creating user %s: %s", sanitize_for_log(primary_email), sanitize_for_log(str(e)))
                 return None
         except Exception as e:
-            logger.error(f"Unexpected error creating user {sanitize_for_log(primary_email)}: {sanitize_for_log(str(e))}")
+            logger.error("Unexpected error creating user %s: %s", sanitize_for_log(primary_email), sanitize_for_log(str(e)))
             return None
 
     def delete_aws_user(self, user_id: str, user_email: str) -> bool:
@@ -253,10 +629,10 @@ class GSuiteAWSSSOSync:
                 IdentityStoreId=self.identity_store_id,
                 UserId=user_id
             )
-            logger.info(f"Deleted AWS SSO user: {sanitize_for_log(user_email)} ({user_id})")
+            logger.info("Deleted AWS SSO user: %s (%s)", sanitize_for_log(user_email), user_id)
             return True
         except Exception as e:
-            logger.error(f"Error deleting user {sanitize_for_log(user_email)}: {sanitize_for_log(str(e))}")
+            logger.error("Error deleting user %s: %s", sanitize_for_log(user_email), sanitize_for_log(str(e)))
             return False
 
     def delete_aws_group(self, group_id: str, group_name: str) -> bool:
@@ -266,10 +642,10 @@ class GSuiteAWSSSOSync:
                 IdentityStoreId=self.identity_store_id,
                 GroupId=group_id
             )
-            logger.info(f"Deleted AWS SSO group: {sanitize_for_log(group_name)} ({group_id})")
+            logger.info("Deleted AWS SSO group: %s (%s)", sanitize_for_log(group_name), group_id)
             return True
         except Exception as e:
-            logger.error(f"Error deleting group {sanitize_for_log(group_name)}: {sanitize_for_log(str(e))}")
+            logger.error("Error deleting group %s: %s", sanitize_for_log(group_name), sanitize_for_log(str(e)))
             return False
 
     def create_aws_group(self, group_name: str, description: str = "") -> Optional[str]:
@@ -282,36 +658,40 @@ class GSuiteAWSSSOSync:
             )
 
             group_id = response['GroupId']
-            logger.info(f"Created AWS SSO group: {sanitize_for_log(group_name)} ({group_id})")
+            logger.info("Created AWS SSO group: %s (%s)", sanitize_for_log(group_name), group_id)
             return group_id
 
         except ClientError as e:
             if e.response['Error']['Code'] == 'ConflictException':
-                logger.warning(f"Group {sanitize_for_log(group_name)} already exists")
-                return None
+                # The group exists but was missing from our listing (e.g. a cached one), so look it up
+                logger.warning("Group %s already exists", sanitize_for_log(group_name))
+                return self.resolve_group_id(group_name)
             else:
-                logger.error(f"Error creating group {sanitize_for_log(group_name)}: {sanitize_for_log(str(e))}")
+                logger.error("Error creating group %s: %s", sanitize_for_log(group_name), sanitize_for_log(str(e)))
                 return None
 
-    def get_aws_group_members(self, group_id: str) -> List[str]:
-        """Get current members of an AWS SSO group"""
-        members = []
+    def get_aws_group_memberships(self, group_id: str) -> Dict[str, str]:
+        """Get current memberships of an AWS SSO group as a user ID to membership ID map"""
+        memberships = {}
 
         try:
-            paginator = self.identity_store.get_paginator('list_group_memberships')
-
-            for page in paginator.paginate(
-                IdentityStoreId=self.identity_store_id,
-                GroupId=group_id
-            ):
+            for page in self._paginate('list_group_memberships', GroupId=group_id):
                 for membership in page['GroupMemberships']:
-                    members.append(membership['MemberId']['UserId'])
+                    memberships[membership['MemberId']['UserId']] = membership['MembershipId']
 
         except Exception as e:
-            logger.error(f"Error fetching group members for {sanitize_for_log(group_id)}: {sanitize_for_log(str(e))}")
-            return []
+            logger.error("Error fetching group members for %s: %s", sanitize_for_log(group_id), sanitize_for_log(str(e)))
+            return {}
 
-        return members
+        return memberships
+
+    def get_aws_groups_memberships(self, group_ids: List[str]) -> Dict[str, Dict[str, str]]:
+        """Fetch the memberships of several AWS SSO groups concurrently, keyed by group ID"""
+        if not group_ids:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(AWS_LIST_MAX_WORKERS, len(group_ids))) as executor:
+            return dict(zip(group_ids, executor.map(self.get_aws_group_memberships, group_ids)))
 
     def add_user_to_group(self, user_id: str, group_id: str) -> bool:
         """Add a user to an AWS SSO group"""
@@ -327,41 +707,69 @@ class GSuiteAWSSSOSync:
             if e.response['Error']['Code'] == 'ConflictException':
                 return True
             else:
-                logger.error(f"Error adding user {sanitize_for_log(user_id)} to group {sanitize_for_log(group_id)}: {sanitize_for_log(str(e))}")
+                logger.error("Error adding user %s to group %s: %s", sanitize_for_log(user_id), sanitize_for_log(group_id), sanitize_for_log(str(e)))
                 return False
 
-    def remove_user_from_group(self, user_id: str, group_id: str) -> bool:
-        """Remove a user from an AWS SSO group"""
+    def remove_user_from_group(self, user_id: str, group_id: str, membership_id: str) -> bool:
+        """Remove a user from an AWS SSO group using its known membership ID"""
         try:
-            paginator = self.identity_store.get_paginator('list_group_memberships')
-
-            for page in paginator.paginate(
+            self.identity_store.delete_group_membership(
                 IdentityStoreId=self.identity_store_id,
-                GroupId=group_id
-            ):
-                for membership in page['GroupMemberships']:
-                    if membership['MemberId']['UserId'] == user_id:
-                        self.identity_store.delete_group_membership(
-                            IdentityStoreId=self.identity_store_id,
-                            MembershipId=membership['MembershipId']
-                        )
-                        return True
-
-            return False
+                MembershipId=membership_id
+            )
+            return True
 
         except Exception as e:
-            logger.error(f"Error removing user {sanitize_for_log(user_id)} from group {sanitize_for_log(group_id)}: {sanitize_for_log(str(e))}")
+            logger.error("Error removing user %s from group %s: %s", sanitize_for_log(user_id), sanitize_for_log(group_id), sanitize_for_log(str(e)))
             return False
 
+    def submit_membership_changes(self, executor: ThreadPoolExecutor, group_id: str, to_add: Set[str],
+                                  to_remove: Dict[str, str]) -> Tuple[Dict[str, Future], Dict[str, Future]]:
+        """Queue the adds and removals for an AWS SSO group on a shared executor
+
+        to_remove maps each user ID to its existing membership ID. Returns the futures keyed by user ID.
+        """
+        # Sorted so changes are issued and logged in a stable order across runs
+        added = {user_id: executor.submit(self.add_user_to_group, user_id, group_id) for user_id in sorted(to_add)}
+        removed = {
+            user_id: executor.submit(self.remove_user_from_group, user_id, group_id, membership_id)
+            for user_id, membership_id in sorted(to_remove.items())
+        }
+        return added, removed
+
+    def log_membership_changes(self, group_name: str, added: Dict[str, Future], removed: Dict[str, Future]):
+        """Wait for a group's queued membership changes and log the outcome"""
+        added_ids = [user_id for user_id, future in added.items() if future.result()]
+        removed_ids = [user_id for user_id, future in removed.items() if future.result()]
+
+        # One summary line per group; the individual user IDs only at debug level
+        logger.info("Group %s: +%s -%s members", sanitize_for_log(group_name), len(added_ids), len(removed_ids))
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        if added_ids:
+            logger.debug("Added users to group %s: %s", sanitize_for_log(group_name), ', '.join(added_ids))
+        if removed_ids:
+            logger.debug("Removed users from group %s: %s", sanitize_for_log(group_name), ', '.join(removed_ids))
+
     def sync_groups(self):
         """Main sync function"""
         logger.info("Starting Google Workspace to AWS SSO group sync...")
-
-        # Get data from both systems
-        google_groups = self.get_google_groups()
-        google_users = self.get_google_users()
-        aws_groups = self.get_aws_groups()
-        aws_users = self.get_aws_users()
+        remove_extra_members = bool(self.sync_config.get('remove_extra_members'))
+
+        # Get data from both systems concurrently; the listings are independent.
+        # Google group members are fetched while the group pages are still streaming in.
+        # User and Identity Store listings are reused across warm invocations
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            google_groups_future = executor.submit(self.get_google_groups_and_members)
+            # Google users stay in this container only; they are not written to S3
+            google_users_future = executor.submit(self._cached, 'google_users', self.get_google_users, False)
+            aws_groups_future = executor.submit(self._cached, 'aws_groups', self.get_aws_groups)
+            aws_users_future = executor.submit(self._cached, 'aws_users', self.get_aws_users)
+
+        google_groups, google_members_by_group = google_groups_future.result()
+        google_users = google_users_future.result()
+        aws_groups = aws_groups_future.result()
+        aws_users = aws_users_future.result()
 
         if not google_groups:
             logger.error("No Google groups found. Exiting.")
@@ -374,7 +782,7 @@ class GSuiteAWSSSOSync:
         missing_users = google_user_emails - set(aws_users.keys())
         
         if missing_users:
-            logger.info(f"Found {len(missing_users)} users to create in AWS SSO")
+            logger.info("Found %s users to create in AWS SSO", len(missing_users))
             for email in missing_users:
                 google_user = google_users_by_email.get(email)
                 if google_user:
@@ -387,109 +795,147 @@ class GSuiteAWSSSOSync:
             return
 
         # Filter groups based on configuration
-        groups_to_sync = []
-        if self.config.get('sync', {}).get('include_groups'):
-            include_list = self.config['sync']['include_groups']
-            groups_to_sync = [g for g in google_groups if g['name'] in include_list]
-        elif self.config.get('sync', {}).get('exclude_groups'):
-            exclude_list = self.config['sync']['exclude_groups']
-            groups_to_sync = [g for g in google_groups if g['name'] not in exclude_list]
-        else:
-            groups_to_sync = google_groups
-
-        logger.info(f"Syncing {len(groups_to_sync)} groups...")
-
-        for google_group in groups_to_sync:
-            group_name = google_group['name']
-            group_email = google_group['email']
-
-            logger.info(f"Processing group: {sanitize_for_log(group_name)}")
-
-            # Create group in AWS SSO if it doesn't exist
-            if group_name not in aws_groups:
-                group_id = self.create_aws_group(
-                    group_name,
-                    google_group.get('description', '')
-                )
-                if group_id:
-                    aws_groups[group_name] = group_id
-                else:
+        groups_to_sync = list(self.filter_groups(google_groups))
+
+        logger.info("Syncing %s groups...", len(groups_to_sync))
+
+        # Fetch current memberships of the groups that already exist in AWS SSO concurrently
+        aws_memberships = self.get_aws_groups_memberships(
+            list({aws_groups[g['name']] for g in groups_to_sync if g['name'] in aws_groups})
+        )
+
+        # Membership changes of all groups share one bounded pool, so the next group is
+        # prepared (and its users and group created) while earlier changes are in flight
+        pending_changes = []
+        with ThreadPoolExecutor(max_workers=AWS_MAX_WORKERS) as mutation_executor:
+            for google_group in groups_to_sync:
+                group_name = google_group['name']
+                group_email = google_group['email']
+
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Processing group: %s", sanitize_for_log(group_name))
+
+                # A failed member fetch must not look like an empty group, or every AWS member would be removed
+                google_members = google_members_by_group.get(group_email)
+                if google_members is None:
+                    logger.warning("Skipping group %s: could not fetch its Google Workspace members", sanitize_for_log(group_name))
                     continue
-            else:
-                group_id = aws_groups[group_name]
-
-            # Get members from both systems
-            google_members = self.get_google_group_members(group_email)
-            aws_member_ids = set(self.get_aws_group_members(group_id))
-
-            # Convert Google members to AWS user IDs
-            google_member_ids = set()
-            for member in google_members:
-                if member['type'] == 'USER':
-                    member_email = member['email']
-                    if member_email in aws_users:
-                        google_member_ids.add(aws_users[member_email])
+
+                # Create group in AWS SSO if it doesn't exist
+                if group_name not in aws_groups:
+                    group_id = self.create_aws_group(
+                        group_name,
+                        google_group.get('description', '')
+                    )
+                    if group_id:
+                        aws_groups[group_name] = group_id
                     else:
-                        # Try to find and create the user if they exist in Google Workspace
-                        google_user = google_users_by_email.get(member_email)
-                        if google_user:
-                            user_id = self.create_aws_user(google_user)
-                            if user_id:
-                                aws_users[member_email] = user_id
-                                google_member_ids.add(user_id)
-                                logger.info(f"Created and added user {sanitize_for_log(member_email)} to sync")
-                            else:
-                                logger.warning(f"Failed to create user {sanitize_for_log(member_email)} in AWS SSO")
-                        else:
-                            logger.warning(f"User {sanitize_for_log(member_email)} not found in Google Workspace or AWS SSO")
-
-            # Add missing members
-            to_add = google_member_ids - aws_member_ids
-            for user_id in to_add:
-                if self.add_user_to_group(user_id, group_id):
-                    logger.info(f"Added user {sanitize_for_log(user_id)} to group {sanitize_for_log(group_name)}")
-
-            # Remove extra members (if configured)
-            if self.config.get('sync', {}).get('remove_extra_members', False):
-                to_remove = aws_member_ids - google_member_ids
-                for user_id in to_remove:
-                    if self.remove_user_from_group(user_id, group_id):
-                        logger.info(f"Removed user {user_id} from group {sanitize_for_log(group_name)}")
+                        continue
+                else:
+                    group_id = aws_groups[group_name]
+
+                # Get current AWS members
+                aws_member_map = aws_memberships.get(group_id)
+                if aws_member_map is None:
+                    aws_member_map = self.get_aws_group_memberships(group_id)
+                aws_member_ids = set(aws_member_map)
+
+                # Convert Google members to AWS user IDs
+                member_emails = {m['email'] for m in google_members if m.get('type') == 'USER'}
+                existing_emails = member_emails & aws_users.keys()
+                google_member_ids = {aws_users[email] for email in existing_emails}
+
+                # Try to create members that exist in Google Workspace but not yet in AWS SSO
+                failed_emails = []
+                unknown_emails = []
+                for member_email in member_emails - existing_emails:
+                    google_user = google_users_by_email.get(member_email)
+                    if not google_user:
+                        unknown_emails.append(member_email)
+                        continue
+                    user_id = self.create_aws_user(google_user)
+                    if user_id:
+                        aws_users[member_email] = user_id
+                        google_member_ids.add(user_id)
+                        logger.info("Created and added user %s to sync", sanitize_for_log(member_email))
+                    else:
+                        failed_emails.append(member_email)
+
+                if failed_emails:
+                    logger.warning("Failed to create %s users in AWS SSO: %s", len(failed_emails), sanitize_for_log(', '.join(sorted(failed_emails))))
+                if unknown_emails:
+                    logger.warning("%s users not found in Google Workspace or AWS SSO: %s", len(unknown_emails), sanitize_for_log(', '.join(sorted(unknown_emails))))
+
+                # Add missing members and remove extra members (if configured); the
+                # reverse difference is only computed when removals are enabled
+                to_add = google_member_ids - aws_member_ids
+                to_remove = {}
+                if remove_extra_members:
+                    to_remove = {user_id: aws_member_map[user_id] for user_id in aws_member_ids - google_member_ids}
+
+                # Nothing to do for groups that are already in sync (the common case)
+                if not to_add and not to_remove:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Group %s in sync (%s members)", sanitize_for_log(group_name), len(google_member_ids))
+                    continue
+
+                pending_changes.append(
+                    (group_name, self.submit_membership_changes(mutation_executor, group_id, to_add, to_remove))
+                )
+
+        for group_name, (added, removed) in pending_changes:
+            self.log_membership_changes(group_name, added, removed)
 
         # Clean up groups that no longer exist in Google Workspace (if configured)
-        if self.config.get('sync', {}).get('remove_extra_members', False):
+        if remove_extra_members:
             logger.info("Checking for groups to remove from AWS SSO...")
             google_group_names = {g['name'] for g in groups_to_sync}
             aws_group_names = set(aws_groups.keys())
             groups_to_remove = aws_group_names - google_group_names
             
             if groups_to_remove:
-                logger.info(f"Found {len(groups_to_remove)} groups to remove from AWS SSO")
-                for group_name in groups_to_remove:
-                    group_id = aws_groups[group_name]
-                    if self.delete_aws_group(group_id, group_name):
-                        logger.info(f"Removed group {sanitize_for_log(group_name)} from AWS SSO")
+                logger.info("Found %s groups to remove from AWS SSO", len(groups_to_remove))
+                with ThreadPoolExecutor(max_workers=min(AWS_MAX_WORKERS, len(groups_to_remove))) as executor:
+                    results = list(executor.map(
+                        lambda group_name: self.delete_aws_group(aws_groups[group_name], group_name),
+                        sorted(groups_to_remove)
+                    ))
+                for group_name, success in zip(sorted(groups_to_remove), results):
+                    if success:
+                        del aws_groups[group_name]
+                        logger.info("Removed group %s from AWS SSO", sanitize_for_log(group_name))
 
         # Clean up users who no longer exist in Google Workspace (if configured)
-        if self.config.get('sync', {}).get('remove_extra_members', False):
+        if remove_extra_members:
             logger.info("Checking for users to remove from AWS SSO...")
             aws_user_emails = set(aws_users.keys())
             users_to_remove = aws_user_emails - google_user_emails
             
             if users_to_remove:
-                logger.info(f"Found {len(users_to_remove)} users to remove from AWS SSO")
-                for email in users_to_remove:
-                    user_id = aws_users[email]
-                    if self.delete_aws_user(user_id, email):
-                        logger.info(f"Removed user {sanitize_for_log(email)} from AWS SSO")
+                logger.info("Found %s users to remove from AWS SSO", len(users_to_remove))
+                with ThreadPoolExecutor(max_workers=min(AWS_MAX_WORKERS, len(users_to_remove))) as executor:
+                    results = list(executor.map(
+                        lambda email: self.delete_aws_user(aws_users[email], email),
+                        sorted(users_to_remove)
+                    ))
+                for email, success in zip(sorted(users_to_remove), results):
+                    if success:
+                        del aws_users[email]
+                        logger.info("Removed user %s from AWS SSO", sanitize_for_log(email))
+
+        # Share the updated listings with later runs
+        self.save_shared_cache()
 
         logger.info("Group sync completed successfully!")
 
 def lambda_handler(event, context):
     """Lambda function handler"""
+    global _SYNC_SERVICE
     try:
-        sync_service = GSuiteAWSSSOSync()
-        sync_service.sync_groups()
+        # Reuse the service from a previous warm invocation until its cache expires
+        if _SYNC_SERVICE is None or _SYNC_SERVICE.is_expired():
+            _SYNC_SERVICE = GSuiteAWSSSOSync()
+        _SYNC_SERVICE.sync_groups()
 
         return {
             'statusCode': 200,
@@ -499,7 +945,7 @@ def lambda_handler(event, context):
             })
         }
     except Exception as e:
-        logger.error(f"Sync failed: {sanitize_for_log(str(e))}")
+        logger.error("Sync failed: %s", sanitize_for_log(str(e)))
         return {
             'statusCode': 500,
             'body': json.dumps({
@@ -3,62 +3,69 @@
 Script to update AWS Secrets Manager with Google service account credentials
 """
 
+import argparse
 import json
 import base64
-import boto3
+import os
 import sys
 from pathlib import Path
 
-def get_stack_parameters(stack_name):
+def get_stack_parameters(session, stack_name):
     """Get parameters from CloudFormation stack"""
     try:
-        # Use region from environment or default
-        import os
-        region = os.environ.get('AWS_DEFAULT_REGION')
-        cf_client = boto3.client('cloudformation', region_name=region)
+        cf_client = session.client('cloudformation')
         response = cf_client.describe_stacks(StackName=stack_name)
         
-        parameters = {}
-        for param in response['Stacks'][0]['Parameters']:
-            parameters[param['ParameterKey']] = param['ParameterValue']
-        
-        return parameters
+        return {param['ParameterKey']: param['ParameterValue'] for param in response['Stacks'][0]['Parameters']}
     except Exception as e:
         print(f"❌ Error getting stack parameters: {e}")
         return None
 
+def service_account_path(value):
+    """Argument type for the service account file; rejects paths that aren't existing files"""
+    file_path = Path(value).resolve()
+    if not file_path.is_file():
+        raise argparse.ArgumentTypeError(f"Invalid service account file: {value}")
+    return file_path
+
+def parse_args():
+    """Parse and validate the command line arguments"""
+    parser = argparse.ArgumentParser(description="Update AWS Secrets Manager with Google service account credentials")
+    parser.add_argument('service_account_file', type=service_account_path,
+                        help="path to the Google service account JSON key")
+    parser.add_argument('stack_name', nargs='?', default='gsuite-aws-sso-sync',
+                        help="CloudFormation stack name (default: %(default)s)")
+    return parser.parse_args()
+
 def update_secret():
     """Update the secret with Google service account credentials"""
     
-    if len(sys.argv) not in [2, 3]:
-        print("Usage: python update-secret.py <path-to-service-account.json> [stack-name]")
-        print("Default stack name: gsuite-aws-sso-sync")
-        sys.exit(1)
-    
-    service_account_file = sys.argv[1]
-    stack_name = sys.argv[2] if len(sys.argv) == 3 else 'gsuite-aws-sso-sync'
+    # The service account path is validated while parsing, before any AWS calls
+    args = parse_args()
+    file_path = args.service_account_file
+    stack_name = args.stack_name
     
     try:
+        # Read service account JSON
+        print(f"📖 Reading service account file: {file_path}")
+        
+        # Encode to base64
+        service_account_b64 = base64.b64encode(file_path.read_bytes()).decode()
+        
+        # Imported here so an argument error doesn't pay for loading boto3
+        import boto3
+
+        # One session for all AWS clients; use region from environment or default
+        session = boto3.session.Session(region_name=os.environ.get('AWS_DEFAULT_REGION'))
+
         # Get stack parameters
         print(f"📋 Getting parameters from CloudFormation stack: {stack_name}")
-        stack_params = get_stack_parameters(stack_name)
+        stack_params = get_stack_parameters(session, stack_name)
         
         if not stack_params:
             print("❌ Could not retrieve stack parameters. Make sure the stack is deployed.")
             sys.exit(1)
         
-        # Validate and read service account JSON
-        print(f"📖 Reading service account file: {service_account_file}")
-        file_path = Path(service_account_file).resolve()
-        if not file_path.exists() or not file_path.is_file():
-            raise ValueError(f"Invalid service account file: {service_account_file}")
-        
-        with open(file_path, 'r') as f:
-            service_account_json = f.read()
-        
-        # Encode to base64
-        service_account_b64 = base64.b64encode(service_account_json.encode()).decode()
-        
         # Parse include/exclude groups from CloudFormation parameters
         include_groups_param = stack_params.get('IncludeGroups', '')
         exclude_groups_param = stack_params.get('ExcludeGroups', '')
@@ -97,28 +104,29 @@ def update_secret():
         
         # Update the secret
         print("🔐 Updating AWS Secrets Manager...")
-        import os
-        region = os.environ.get('AWS_DEFAULT_REGION')
-        secrets_client = boto3.client('secretsmanager', region_name=region)
+        secrets_client = session.client('secretsmanager')
         
         response = secrets_client.update_secret(
             SecretId='gsuite-aws-sso-sync-config',
             SecretString=json.dumps(secret_config, indent=2)
         )
         
-        print("✅ Secret updated successfully!")
-        print(f"Secret ARN: {response['ARN']}")
-        print(f"Version ID: {response['VersionId']}")
-        print("\n📊 Configuration Summary:")
-        print(f"  Domain: {stack_params['GoogleDomain']}")
-        print(f"  Admin Email: {stack_params['GoogleAdminEmail']}")
-        print(f"  Identity Store ID: {stack_params['IdentityStoreId']}")
-        print(f"  Include Groups: {include_groups or 'All groups'}")
-        print(f"  Exclude Groups: {exclude_groups or 'None'}")
-        print(f"  Remove Extra Members: {stack_params.get('RemoveExtraMembers', 'false')}")
+        # Assemble the summary and print it at once instead of line by line
+        print("\n".join([
+            "✅ Secret updated successfully!",
+            f"Secret ARN: {response['ARN']}",
+            f"Version ID: {response['VersionId']}",
+            "\n📊 Configuration Summary:",
+            f"  Domain: {stack_params['GoogleDomain']}",
+            f"  Admin Email: {stack_params['GoogleAdminEmail']}",
+            f"  Identity Store ID: {stack_params['IdentityStoreId']}",
+            f"  Include Groups: {include_groups or 'All groups'}",
+            f"  Exclude Groups: {exclude_groups or 'None'}",
+            f"  Remove Extra Members: {stack_params.get('RemoveExtraMembers', 'false')}"
+        ]))
         
     except FileNotFoundError:
-        print(f"❌ Service account file not found: {service_account_file}")
+        print(f"❌ Service account file not found: {file_path}")
         sys.exit(1)
     except Exception as e:
         print(f"❌ Error updating secret: {e}")